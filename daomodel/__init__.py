@@ -1,8 +1,11 @@
-from typing import Any, Iterable, Optional
+from functools import wraps
+from operator import attrgetter
+from typing import Any, Callable, Iterable, Optional
+from weakref import WeakKeyDictionary
 
 from pydantic_core import PydanticUndefined
 from sqlmodel import SQLModel
-from sqlalchemy import Column, Engine, MetaData, Connection, ForeignKey
+from sqlalchemy import Column, Engine, Connection, ForeignKey, inspect
 from str_case_util import Case
 from sqlalchemy.ext.declarative import declared_attr
 
@@ -15,6 +18,21 @@ from daomodel.property_filter import PropertyFilter, ALL
 ColumnBreadcrumbs = tuple[type['DAOModel'], ..., Column]
 
 
+def _cached_per_model(func: Callable) -> Callable:
+    """Stores the result of a classmethod within the class dict of the Model it was called upon.
+
+    The value is freed along with the Model and, as only `cls.__dict__` is checked, is never inherited by a subclass.
+    """
+    attribute = f'_cached_{func.__name__.lstrip("_")}'
+
+    @wraps(func)
+    def wrapper(cls: type['DAOModel']) -> Any:
+        if attribute not in cls.__dict__:
+            setattr(cls, attribute, func(cls))
+        return cls.__dict__[attribute]
+    return wrapper
+
+
 class DAOModel(SQLModel, metaclass=DAOModelMetaclass):
     """An SQLModel specifically designed to support a DAO."""
 
@@ -28,6 +46,7 @@ class DAOModel(SQLModel, metaclass=DAOModelMetaclass):
         return column.table.name == cls.__tablename__
 
     @classmethod
+    @_cached_per_model
     def normalized_name(cls) -> str:
         """A normalized version of this Model name.
 
@@ -36,6 +55,7 @@ class DAOModel(SQLModel, metaclass=DAOModelMetaclass):
         return Case.SNAKE_CASE.format(cls.__name__)
 
     @classmethod
+    @_cached_per_model
     def doc_name(cls) -> str:
         """A reader-friendly version of this Model name to be used within documentation.
 
@@ -57,21 +77,37 @@ class DAOModel(SQLModel, metaclass=DAOModelMetaclass):
 
         :return: A list (of str) of the primary key
         """
-        return names_of(cls.get_pk())
+        return list(cls._pk_names())
+
+    @classmethod
+    @_cached_per_model
+    def _pk_names(cls) -> tuple[str, ...]:
+        """The primary key names backing `get_pk_names`."""
+        return tuple(names_of(cls.get_pk()))
 
     def get_pk_values(self) -> tuple:
         """Returns the values that comprise the Primary Key for this instance of the Model.
 
         :return: A tuple of primary key values
         """
-        return tuple(getattr(self, key) for key in names_of(self.get_pk()))
+        return self._pk_getter()(self)
+
+    @classmethod
+    @_cached_per_model
+    def _pk_getter(cls) -> Callable[['DAOModel'], tuple]:
+        """Builds a reusable function to read the primary key values of an instance as a tuple."""
+        pk_names = cls._pk_names()
+        getter = attrgetter(*pk_names)
+        if len(pk_names) == 1:
+            return lambda model: (getter(model),)
+        return getter
 
     def get_pk_dict(self) -> dict[str, Any]:
         """Returns the Primary Key values for this instance of the Model.
 
         :return: A dict of primary key names/values
         """
-        return self.model_dump(include=set(self.get_pk_names()))
+        return dict(zip(self._pk_names(), self.get_pk_values()))
 
     @classmethod
     def get_fks(cls) -> set[Column]:
@@ -81,7 +117,13 @@ class DAOModel(SQLModel, metaclass=DAOModelMetaclass):
 
         :return: An unordered set of columns
         """
-        return {fk.column for fk in cls.__table__.foreign_keys}
+        return set(cls._fks())
+
+    @classmethod
+    @_cached_per_model
+    def _fks(cls) -> frozenset[Column]:
+        """The referenced Columns backing `get_fks`."""
+        return frozenset(fk.column for fk in cls.__table__.foreign_keys)
 
     @classmethod
     def get_fk_properties(cls) -> set[Column]:
@@ -89,7 +131,13 @@ class DAOModel(SQLModel, metaclass=DAOModelMetaclass):
 
         :return: An unordered set of foreign key columns
         """
-        return {fk.parent for fk in cls.__table__.foreign_keys}
+        return set(cls._fk_properties())
+
+    @classmethod
+    @_cached_per_model
+    def _fk_properties(cls) -> frozenset[Column]:
+        """The foreign key Columns backing `get_fk_properties`."""
+        return frozenset(fk.parent for fk in cls.__table__.foreign_keys)
 
     @classmethod
     def get_references_of(cls, model: type['DAOModel']) -> set[ForeignKey]:
@@ -97,7 +145,16 @@ class DAOModel(SQLModel, metaclass=DAOModelMetaclass):
 
         :return: An unordered set of foreign key columns
         """
-        return {fk for fk in cls.__table__.foreign_keys if model.has_column(fk.column)}
+        references = cls._references_by_model()
+        if model not in references:
+            references[model] = frozenset(fk for fk in cls.__table__.foreign_keys if model.has_column(fk.column))
+        return set(references[model])
+
+    @classmethod
+    @_cached_per_model
+    def _references_by_model(cls) -> WeakKeyDictionary:
+        """The results of `get_references_of`, weakly keyed so that a referenced Model may still be freed."""
+        return WeakKeyDictionary()
 
     @classmethod
     def get_properties(cls) -> Iterable[Column]:
@@ -110,6 +167,12 @@ class DAOModel(SQLModel, metaclass=DAOModelMetaclass):
         """
         return cls.__table__.c
 
+    @classmethod
+    @_cached_per_model
+    def _property_names(cls) -> tuple[str, ...]:
+        """The names of all properties, in the order of `get_properties`, computed once per Model."""
+        return tuple(names_of(cls.get_properties()))
+
     def get_property_names(self, *filters: PropertyFilter) -> list[str]:
         """Returns the names of the specified properties for this record.
 
@@ -212,7 +275,7 @@ class DAOModel(SQLModel, metaclass=DAOModelMetaclass):
                     prop_filter &= next_filter
 
         result = prop_filter.evaluate(self)
-        return in_order(result, names_of(self.get_properties()))
+        return in_order(result, self._property_names())
 
     def get_property_values(self, *filters: PropertyFilter) -> dict[str, Any]:
         """Reads values of the specified properties for this record.
@@ -275,10 +338,16 @@ class DAOModel(SQLModel, metaclass=DAOModelMetaclass):
 
         :return: A list of searchable columns
         """
+        return list(cls._searchable_properties())
+
+    @classmethod
+    @_cached_per_model
+    def _searchable_properties(cls) -> tuple[Column | ColumnBreadcrumbs, ...]:
+        """The searchable Columns and breadcrumbs backing `get_searchable_properties`."""
         unsearchable = getattr(getattr(cls, '_unsearchable', None), 'default', set())
         searchable = [column for column in cls.get_properties() if column.name not in unsearchable]
         searchable.extend(getattr(getattr(cls, 'Meta', None), 'searchable_relations', set()))
-        return searchable
+        return tuple(searchable)
 
     @classmethod
     def find_searchable_column(cls, prop: str|Column, foreign_tables: list[type['DAOModel']]) -> Column:
@@ -291,17 +360,33 @@ class DAOModel(SQLModel, metaclass=DAOModelMetaclass):
         """
         if type(prop) is not str:
             prop = reference_of(prop)
-        for column in cls.get_searchable_properties():
+        searchable = cls._searchable_columns()
+        candidates = [prop, f'{cls.normalized_name()}.{prop}', f'{cls.normalized_name()}_{prop}']
+        matches = [searchable[reference] for reference in candidates if reference in searchable]
+        if not matches:
+            raise UnsearchableError(prop, cls)
+        _, column, tables = min(matches)
+        foreign_tables.extend(tables)
+        return column
+
+    @classmethod
+    @_cached_per_model
+    def _searchable_columns(cls) -> dict[str, tuple[int, Column, tuple]]:
+        """Indexes the searchable Columns by their 'table.column' reference.
+
+        Each entry holds the position of the Column within `get_searchable_properties`,
+        so that the earliest match wins, along with the foreign tables needed to reach it.
+        """
+        searchable = {}
+        for position, column in enumerate(cls._searchable_properties()):
             tables = []
             if type(column) is tuple:
-                tables = column[:-1]
+                tables = [t.__table__ for t in column[:-1]]
                 column = column[-1]
-            if reference_of(column) in [prop, f'{cls.normalized_name()}.{prop}', f'{cls.normalized_name()}_{prop}']:
-                foreign_tables.extend([t.__table__ for t in tables])
-                if column.table is not cls.__table__:
-                    foreign_tables.append(column.table)
-                return column
-        raise UnsearchableError(prop, cls)
+            if column.table is not cls.__table__:
+                tables.append(column.table)
+            searchable.setdefault(reference_of(column), (position, column, tuple(tables)))
+        return searchable
 
     @classmethod
     def pk_values_to_dict(cls, *pk_values: Any) -> dict[str, Any]:
@@ -310,7 +395,7 @@ class DAOModel(SQLModel, metaclass=DAOModelMetaclass):
         :param pk_values: The primary key values, in order
         :return: A new dict containing the primary key values
         """
-        return dict(zip(cls.get_pk_names(), *pk_values))
+        return dict(zip(cls._pk_names(), *pk_values))
 
     def copy_model(self, source: 'DAOModel', *fields: str) -> None:
         """Copies values from another instance of this Model.
@@ -323,7 +408,7 @@ class DAOModel(SQLModel, metaclass=DAOModelMetaclass):
         if fields:
             values = source.model_dump(include=set(fields))
         else:
-            values = source.model_dump(exclude=set(source.get_pk_names()))
+            values = source.model_dump(exclude=set(source._pk_names()))
         self.set_values(**values)
 
     def set_values(self, ignore_pk: Optional[bool] = False, **values: Any) -> None:
@@ -334,11 +419,10 @@ class DAOModel(SQLModel, metaclass=DAOModelMetaclass):
         :param ignore_pk: True if you also wish to not set Primary Key values
         :param values: The dict including values to set
         """
-        values = retain_in_dict(values, *names_of(self.get_properties()))
-        if ignore_pk:
-            values = remove_from_dict(values, *self.get_pk_names())
-        for k, v in values.items():
-            setattr(self, k, v)
+        excluded = self._pk_names() if ignore_pk else ()
+        for name in self._property_names():
+            if name in values and name not in excluded:
+                setattr(self, name, values[name])
 
     def __eq__(self, other: 'DAOModel') -> bool:
         """Instances are determined to be equal based on only their primary key."""
@@ -378,7 +462,5 @@ def all_models(bind: [Engine|Connection]) -> set[type[DAOModel]]:
             subclasses.update(daomodel_subclasses(subclass))
         return subclasses
 
-    metadata = MetaData()
-    metadata.reflect(bind=bind)
-    db_tables = metadata.tables.keys()
+    db_tables = set(inspect(bind).get_table_names())
     return {model for model in daomodel_subclasses(DAOModel) if model.__tablename__ in db_tables}
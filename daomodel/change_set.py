@@ -179,7 +179,7 @@ class ChangeSet(ModelDiff):
         resolution = resolution_method(self.all_values(field)) if callable(resolution_method) else resolution_method
 
         preference = self.map_resolution_to_preference(resolution, field)
-        if preference == Preference.NEITHER:
+        if preference is Preference.NEITHER:
             preference = resolution
         return preference
 
@@ -191,17 +191,18 @@ class ChangeSet(ModelDiff):
         """
         for field in list(self.keys()):
             preferred = self.get_preferred(field)
-            if preferred == Preference.BOTH:
+            if preferred is Preference.BOTH:
                 preferred = self.resolve_conflict(field)
+            baseline, target = self[field]
             match preferred:
                 case Preference.NOT_APPLICABLE | Preference.NEITHER | Preference.BOTH:
-                    self[field] = (self.get_baseline(field), Unresolved(self.get_target(field)))
+                    self[field] = (baseline, Unresolved(target))
                 case Preference.LEFT:
                     del self[field]
                 case Preference.RIGHT:
                     pass
                 case _:
-                    self[field] = (self.get_baseline(field), Resolved(self.get_target(field), preferred))
+                    self[field] = (baseline, Resolved(target, preferred))
         return self
 
     def apply(self) -> T:
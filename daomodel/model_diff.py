@@ -53,12 +53,11 @@ class ModelDiff(dict[str, tuple[Any, Any]]):
         self.preference_rules = preference_rules
 
         filter_expr = [] if include_pk else [~PK]
-        left_values = left.get_property_values(*filter_expr)
-        right_values = right.get_property_values(*filter_expr)
-
-        for k, v in left_values.items():
-            if right_values[k] != v:
-                self[k] = (v, right_values[k])
+        for field in left.get_property_names(*filter_expr):
+            left_value = left.get_value_of(field)
+            right_value = right.get_value_of(field)
+            if right_value != left_value:
+                self[field] = (left_value, right_value)
 
     def has_left_value(self, field: str) -> bool:
         """Returns True if the left value for the specified field exists"""
@@ -65,8 +65,7 @@ class NotFilter(PropertyFilter):
     
     def evaluate(self, model) -> set[str]:
         """Returns properties that do NOT match the given filter."""
-        all_props = set(names_of(model.get_properties()))
-        return all_props.difference(self.operand.evaluate(model))
+        return ALL.evaluate(model).difference(self.operand.evaluate(model))
     
     def __repr__(self):
         return f'~{self.operand}'
@@ -42,21 +42,16 @@ def labeled_tests(tests: dict[str, TestCases]):
             if not isinstance(test_cases, list):
                 test_cases = [test_cases]
 
-            expected = None
-            try:
-                expected_case = next(case for case in test_cases if isinstance(case, Expected))
-                expected = expected_case.value
-                test_cases.remove(expected_case)
-                found_expected = True
-            except StopIteration:
-                found_expected = False
-
-            for test_case in test_cases if isinstance(test_cases, list) else [test_cases]:
-                if found_expected:
+            expected_case = next((case for case in test_cases if isinstance(case, Expected)), None)
+
+            for test_case in test_cases:
+                if expected_case is not None:
+                    if test_case is expected_case:
+                        continue
                     if isinstance(test_case, tuple):
-                        test_case = (*test_case, expected)
+                        test_case = (*test_case, expected_case.value)
                     else:
-                        test_case = (test_case, expected)
+                        test_case = (test_case, expected_case.value)
                 _validate_parameters(param_count, test_case)
                 labels.append(group_label)
                 test_data.append(test_case)
@@ -1,3 +1,4 @@
+from operator import itemgetter
 from typing import Iterable, Any
 
 from sqlalchemy import Column
@@ -54,13 +55,13 @@ def values_from_dict(*keys: Any, **values: Any) -> tuple:
     :param values: The dictionary containing the values
     :return: A tuple of values read from the dict, in the same order as keys
     """
-    result = []
-    for key in keys:
-        if key in values:
-            result.append(values[key])
-        else:
-            raise MissingInput(f'Requested key {key} not found in dictionary')
-    return tuple(result)
+    if not keys:
+        return ()
+    try:
+        result = itemgetter(*keys)(values)
+    except KeyError as e:
+        raise MissingInput(f'Requested key {e.args[0]} not found in dictionary') from None
+    return result if len(keys) > 1 else (result,)
 
 
 def retain_in_dict(d: dict[Any, Any], *keys: Any) -> dict[Any, Any]:
@@ -19,25 +19,29 @@ class CalendarEvent(DAOModel, table=True):
     description: Optional[str]
 
 
+dads_description = 'Annual family picnic with games and BBQ.'
+moms_description = 'Picnic with family and friends, do not forget the salads!'
+sons_description = 'Bring your football and frisbee!'
+
 dads_entry = CalendarEvent(
     title='Family Picnic',
     day=date(2025, 6, 20),
     time='11:00 AM',
     location='Central Park',
-    description='Annual family picnic with games and BBQ.'
+    description=dads_description
 )
 moms_entry = CalendarEvent(
     title='Family Picnic',
     day=date(2025, 6, 20),
     time='12:00 PM',
     location='Central Park',
-    description='Picnic with family and friends, do not forget the salads!'
+    description=moms_description
 )
 sons_entry = CalendarEvent(
     title='Family Picnic',
     day=date(2025, 6, 19),
     time='12:00 PM',
-    description='Bring your football and frisbee!'
+    description=sons_description
 )
 daughters_entry = CalendarEvent(
     title='Family Picnic',
@@ -99,7 +103,7 @@ def test_has_target_value(change_set: ChangeSet, field: str, expected: bool):
     'ChangeSet':
         (ChangeSet(dads_entry, moms_entry), 'time', ['11:00 AM', '12:00 PM']),
     'ChangeSet None Baseline':
-        (ChangeSet(daughters_entry, sons_entry), 'description', [None, 'Bring your football and frisbee!']),
+        (ChangeSet(daughters_entry, sons_entry), 'description', [None, sons_description]),
     'Single Target MergeSet':
         (MergeSet(dads_entry, sons_entry), 'day', [date(2025, 6, 20), date(2025, 6, 19)]),
     'Multiple Target MergeSet':
@@ -116,9 +120,9 @@ def test_has_target_value(change_set: ChangeSet, field: str, expected: bool):
         ]),
     'Multiple Target MergeSet with None value':
         (MergeSet(dads_entry, moms_entry, sons_entry, daughters_entry), 'description', [
-            'Annual family picnic with games and BBQ.',
-            'Picnic with family and friends, do not forget the salads!',
-            'Bring your football and frisbee!',
+            dads_description,
+            moms_description,
+            sons_description,
             None
         ]),
     'Multiple Target MergeSet with None Baseline':
@@ -143,11 +147,11 @@ def test_get_resolution():
     change_set = ChangeSet(dads_entry, moms_entry, **rules)
     change_set.resolve_preferences()
     assert (change_set.get_resolution('description') ==
-            'Annual family picnic with games and BBQ.\n\nPicnic with family and friends, do not forget the salads!')
+            f'{dads_description}\n\n{moms_description}')
     change_set = ChangeSet(moms_entry, dads_entry, **rules)
     change_set.resolve_preferences()
     assert (change_set.get_resolution('description') ==
-            'Picnic with family and friends, do not forget the salads!\n\nAnnual family picnic with games and BBQ.')
+            f'{moms_description}\n\n{dads_description}')
 
 
 def test_get_resolution__unresolved():
@@ -204,11 +208,11 @@ def test_get_preferred(baseline: CalendarEvent, target: CalendarEvent, field: st
         (MergeSet(dads_entry, sons_entry, daughters_entry, description_conflict=None), 'description', (Preference.RIGHT, 1)),
     'both': [
         (ChangeSet(dads_entry, moms_entry, description_conflict='\n\n'.join), 'description',
-         'Annual family picnic with games and BBQ.\n\nPicnic with family and friends, do not forget the salads!'),
+         f'{dads_description}\n\n{moms_description}'),
         (MergeSet(dads_entry, moms_entry, description_conflict='\n\n'.join), 'description',
-         'Annual family picnic with games and BBQ.\n\nPicnic with family and friends, do not forget the salads!'),
+         f'{dads_description}\n\n{moms_description}'),
         (MergeSet(dads_entry, moms_entry, sons_entry, description_conflict='\n\n'.join), 'description',
-         'Annual family picnic with games and BBQ.\n\nPicnic with family and friends, do not forget the salads!\n\nBring your football and frisbee!')
+         f'{dads_description}\n\n{moms_description}\n\n{sons_description}')
     ],
     'default conflict resolution': [
         (ChangeSet(dads_entry, moms_entry, default_conflict=Preference.LEFT), 'time', Preference.LEFT),
@@ -247,17 +251,17 @@ def test_resolve_conflict__missing():
     'dad => mom':
         (dads_entry, moms_entry, {
             'description': (
-                    'Annual family picnic with games and BBQ.',
-                    Resolved('Picnic with family and friends, do not forget the salads!',
-                             'Annual family picnic with games and BBQ.\n\nPicnic with family and friends, do not forget the salads!')
+                    dads_description,
+                    Resolved(moms_description,
+                             f'{dads_description}\n\n{moms_description}')
             )
         }),
     'dad => son':
         (dads_entry, sons_entry, {
             'description': (
-                    'Annual family picnic with games and BBQ.',
-                    Resolved('Bring your football and frisbee!',
-                             'Annual family picnic with games and BBQ.\n\nBring your football and frisbee!')
+                    dads_description,
+                    Resolved(sons_description,
+                             f'{dads_description}\n\n{sons_description}')
             )
         }),
     'dad => daughter':
@@ -266,17 +270,17 @@ def test_resolve_conflict__missing():
         (moms_entry, dads_entry, {
             'time': ('12:00 PM', '11:00 AM'),
             'description': (
-                    'Picnic with family and friends, do not forget the salads!',
-                    Resolved('Annual family picnic with games and BBQ.',
-                             'Picnic with family and friends, do not forget the salads!\n\nAnnual family picnic with games and BBQ.')
+                    moms_description,
+                    Resolved(dads_description,
+                             f'{moms_description}\n\n{dads_description}')
             )
         }),
     'mom => son':
         (moms_entry, sons_entry, {
             'description': (
-                    'Picnic with family and friends, do not forget the salads!',
-                    Resolved('Bring your football and frisbee!',
-                             'Picnic with family and friends, do not forget the salads!\n\nBring your football and frisbee!')
+                    moms_description,
+                    Resolved(sons_description,
+                             f'{moms_description}\n\n{sons_description}')
             )
         }),
     'mom => daughter':
@@ -287,9 +291,9 @@ def test_resolve_conflict__missing():
             'time': ('12:00 PM', '11:00 AM'),
             'location': (None, 'Central Park'),
             'description': (
-                    'Bring your football and frisbee!',
-                    Resolved('Annual family picnic with games and BBQ.',
-                             'Bring your football and frisbee!\n\nAnnual family picnic with games and BBQ.')
+                    sons_description,
+                    Resolved(dads_description,
+                             f'{sons_description}\n\n{dads_description}')
             )
         }),
     'son => mom':
@@ -297,9 +301,9 @@ def test_resolve_conflict__missing():
             'day': (date(2025, 6, 19), date(2025, 6, 20)),
             'location': (None, 'Central Park'),
             'description': (
-                    'Bring your football and frisbee!',
-                    Resolved('Picnic with family and friends, do not forget the salads!',
-                             'Bring your football and frisbee!\n\nPicnic with family and friends, do not forget the salads!')
+                    sons_description,
+                    Resolved(moms_description,
+                             f'{sons_description}\n\n{moms_description}')
             )
         }),
     'son => daughter':
@@ -310,17 +314,17 @@ def test_resolve_conflict__missing():
     'daughter => dad':
         (daughters_entry, dads_entry, {
             'time': ('All Day', '11:00 AM'),
-            'description': (None, 'Annual family picnic with games and BBQ.')
+            'description': (None, dads_description)
         }),
     'daughter => mom':
         (daughters_entry, moms_entry, {
             'time': ('All Day', '12:00 PM'),
-            'description': (None, 'Picnic with family and friends, do not forget the salads!')
+            'description': (None, moms_description)
         }),
     'daughter => son':
         (daughters_entry, sons_entry, {
             'time': ('All Day', '12:00 PM'),
-            'description': (None, 'Bring your football and frisbee!')
+            'description': (None, sons_description)
         })
 })
 def test_resolve_preferences(baseline: CalendarEvent, target: CalendarEvent, expected: dict[str, tuple[Any, Any|Resolved]]):
@@ -351,7 +355,7 @@ def test_resolve_preferences__conflict():
             day=date(2025, 6, 20),
             time='11:00 AM',
             location='Central Park',
-            description='Annual family picnic with games and BBQ.\n\nPicnic with family and friends, do not forget the salads!'
+            description=f'{dads_description}\n\n{moms_description}'
         )),
     'dad => son':
         (dads_entry, sons_entry, CalendarEvent(
@@ -359,7 +363,7 @@ def test_resolve_preferences__conflict():
             day=date(2025, 6, 20),
             time='11:00 AM',
             location='Central Park',
-            description='Bring your football and frisbee!\n\nAnnual family picnic with games and BBQ.'
+            description=f'{sons_description}\n\n{dads_description}'
         )),
     'dad => daughter':
         (dads_entry, daughters_entry, CalendarEvent(
@@ -367,7 +371,7 @@ def test_resolve_preferences__conflict():
             day=date(2025, 6, 20),
             time='11:00 AM',
             location='Central Park',
-            description='Annual family picnic with games and BBQ.'
+            description=dads_description
         )),
     'mom => dad':
         (moms_entry, dads_entry, CalendarEvent(
@@ -375,7 +379,7 @@ def test_resolve_preferences__conflict():
             day=date(2025, 6, 20),
             time='12:00 PM',
             location='Central Park',
-            description='Annual family picnic with games and BBQ.\n\nPicnic with family and friends, do not forget the salads!'
+            description=f'{dads_description}\n\n{moms_description}'
         )),
     'mom => son':
         (moms_entry, sons_entry, CalendarEvent(
@@ -383,7 +387,7 @@ def test_resolve_preferences__conflict():
             day=date(2025, 6, 20),
             time='12:00 PM',
             location='Central Park',
-            description='Bring your football and frisbee!\n\nPicnic with family and friends, do not forget the salads!'
+            description=f'{sons_description}\n\n{moms_description}'
         )),
     'mom => daughter':
         (moms_entry, daughters_entry, CalendarEvent(
@@ -391,7 +395,7 @@ def test_resolve_preferences__conflict():
             day=date(2025, 6, 20),
             time='12:00 PM',
             location='Central Park',
-            description='Picnic with family and friends, do not forget the salads!'
+            description=moms_description
         )),
     'son => dad':
         (sons_entry, dads_entry, CalendarEvent(
@@ -399,7 +403,7 @@ def test_resolve_preferences__conflict():
             day=date(2025, 6, 20),
             time='11:00 AM',
             location='Central Park',
-            description='Annual family picnic with games and BBQ.\n\nBring your football and frisbee!'
+            description=f'{dads_description}\n\n{sons_description}'
         )),
     'son => mom':
         (sons_entry, moms_entry, CalendarEvent(
@@ -407,7 +411,7 @@ def test_resolve_preferences__conflict():
             day=date(2025, 6, 20),
             time='12:00 PM',
             location='Central Park',
-            description='Picnic with family and friends, do not forget the salads!\n\nBring your football and frisbee!'
+            description=f'{moms_description}\n\n{sons_description}'
         )),
     'son => daughter':
         (sons_entry, daughters_entry, CalendarEvent(
@@ -415,7 +419,7 @@ def test_resolve_preferences__conflict():
             day=date(2025, 6, 20),
             time='12:00 PM',
             location='Central Park',
-            description='Bring your football and frisbee!'
+            description=sons_description
         )),
     'daughter => dad':
         (daughters_entry, dads_entry, CalendarEvent(
@@ -423,7 +427,7 @@ def test_resolve_preferences__conflict():
             day=date(2025, 6, 20),
             time='11:00 AM',
             location='Central Park',
-            description='Annual family picnic with games and BBQ.'
+            description=dads_description
         )),
     'daughter => mom':
         (daughters_entry, moms_entry, CalendarEvent(
@@ -431,7 +435,7 @@ def test_resolve_preferences__conflict():
             day=date(2025, 6, 20),
             time='12:00 PM',
             location='Central Park',
-            description='Picnic with family and friends, do not forget the salads!'
+            description=moms_description
         )),
     'daughter => son':
         (daughters_entry, sons_entry, CalendarEvent(
@@ -439,7 +443,7 @@ def test_resolve_preferences__conflict():
             day=date(2025, 6, 20),
             time='12:00 PM',
             location='Central Park',
-            description='Bring your football and frisbee!'
+            description=sons_description
         )),
 })
 def test_apply(baseline: CalendarEvent, target: CalendarEvent, expected: CalendarEvent):
@@ -455,7 +459,7 @@ def test_apply(baseline: CalendarEvent, target: CalendarEvent, expected: Calenda
             day=date(2025, 6, 20),
             time='11:00 AM',
             location='Central Park',
-            description='Annual family picnic with games and BBQ.'
+            description=dads_description
         )),
     'mom <= son, daughter, dad':
         (moms_entry, [sons_entry, daughters_entry, dads_entry], CalendarEvent(
@@ -463,7 +467,7 @@ def test_apply(baseline: CalendarEvent, target: CalendarEvent, expected: Calenda
             day=date(2025, 6, 20),
             time='11:00 AM',
             location='Central Park',
-            description='Picnic with family and friends, do not forget the salads!'
+            description=moms_description
         )),
     'son <= daughter, dad, mom':
         (sons_entry, [daughters_entry, dads_entry, moms_entry], CalendarEvent(
@@ -471,7 +475,7 @@ def test_apply(baseline: CalendarEvent, target: CalendarEvent, expected: Calenda
             day=date(2025, 6, 20),
             time='11:00 AM',
             location='Central Park',
-            description='Bring your football and frisbee!'
+            description=sons_description
         )),
     'daughter <= dad, mom, son':
         (sons_entry, [daughters_entry, dads_entry, moms_entry], CalendarEvent(
@@ -479,7 +483,7 @@ def test_apply(baseline: CalendarEvent, target: CalendarEvent, expected: Calenda
             day=date(2025, 6, 20),
             time='11:00 AM',
             location='Central Park',
-            description='Annual family picnic with games and BBQ.'
+            description=dads_description
         )),
 })
 def test_apply__merge_set(baseline: CalendarEvent, target: list[CalendarEvent], expected: CalendarEvent):
@@ -494,8 +498,8 @@ def test_apply__merge_set(baseline: CalendarEvent, target: list[CalendarEvent],
             'time': ('11:00 AM', [
                 '12:00 PM'
             ]),
-            'description': ('Annual family picnic with games and BBQ.', [
-                'Picnic with family and friends, do not forget the salads!'
+            'description': (dads_description, [
+                moms_description
             ])
         }),
     'multiple other models': [
@@ -512,9 +516,9 @@ def test_apply__merge_set(baseline: CalendarEvent, target: list[CalendarEvent],
                 'Central Park',
                 None
             ]),
-            'description': ('Annual family picnic with games and BBQ.', [
-                'Picnic with family and friends, do not forget the salads!',
-                'Bring your football and frisbee!'
+            'description': (dads_description, [
+                moms_description,
+                sons_description
             ])
         }),
         (dads_entry, [moms_entry, daughters_entry], {
@@ -526,8 +530,8 @@ def test_apply__merge_set(baseline: CalendarEvent, target: list[CalendarEvent],
                 'Central Park',
                 'The Park'
             ]),
-            'description': ('Annual family picnic with games and BBQ.', [
-                'Picnic with family and friends, do not forget the salads!',
+            'description': (dads_description, [
+                moms_description,
                 None
             ])
         }),
@@ -544,8 +548,8 @@ def test_apply__merge_set(baseline: CalendarEvent, target: list[CalendarEvent],
                 None,
                 'The Park'
             ]),
-            'description': ('Annual family picnic with games and BBQ.', [
-                'Bring your football and frisbee!',
+            'description': (dads_description, [
+                sons_description,
                 None
             ])
         }),
@@ -567,9 +571,9 @@ def test_apply__merge_set(baseline: CalendarEvent, target: list[CalendarEvent],
                 None,
                 'The Park'
             ]),
-            'description': ('Annual family picnic with games and BBQ.', [
-                'Picnic with family and friends, do not forget the salads!',
-                'Bring your football and frisbee!',
+            'description': (dads_description, [
+                moms_description,
+                sons_description,
                 None
             ])
         }),
@@ -589,10 +593,10 @@ def test_apply__merge_set(baseline: CalendarEvent, target: list[CalendarEvent],
                 'Central Park',
                 'Central Park'
             ]),
-            'description': ('Bring your football and frisbee!', [
+            'description': (sons_description, [
                 None,
-                'Picnic with family and friends, do not forget the salads!',
-                'Annual family picnic with games and BBQ.'
+                moms_description,
+                dads_description
             ])
         }),
         (moms_entry, [dads_entry, daughters_entry, sons_entry], {
@@ -611,10 +615,10 @@ def test_apply__merge_set(baseline: CalendarEvent, target: list[CalendarEvent],
                 'The Park',
                 None,
             ]),
-            'description': ('Picnic with family and friends, do not forget the salads!', [
-                'Annual family picnic with games and BBQ.',
+            'description': (moms_description, [
+                dads_description,
                 None,
-                'Bring your football and frisbee!',
+                sons_description,
             ])
         }),
         (daughters_entry, [moms_entry, dads_entry, sons_entry], {
@@ -634,9 +638,9 @@ def test_apply__merge_set(baseline: CalendarEvent, target: list[CalendarEvent],
                 None
             ]),
             'description': (None, [
-                'Picnic with family and friends, do not forget the salads!',
-                'Annual family picnic with games and BBQ.',
-                'Bring your football and frisbee!'
+                moms_description,
+                dads_description,
+                sons_description
             ])
         })
     ]
@@ -58,6 +58,18 @@ def test_tablename():
     assert ForeignKEYModel.__tablename__ == 'foreign_key_model'
 
 
+def test_tablename__parent_name_cached():
+    class NamedBase(DAOModel):
+        pass
+
+    assert NamedBase.normalized_name() == 'named_base'
+
+    class NamedChild(NamedBase, table=True):
+        id: Identifier[int]
+
+    assert NamedChild.__tablename__ == 'named_child'
+
+
 @labeled_tests({
     'true': [
         (SimpleModel, SimpleModel.pkA, True),
@@ -338,6 +350,19 @@ def test_get_searchable_properties__meta(expected: Column | ColumnBreadcrumbs):
     assert expected in ComplicatedModel.get_searchable_properties()
 
 
+def test_get_searchable_properties__parent_cached():
+    class SearchableParent(DAOModel, table=True):
+        id: Identifier[int]
+
+    assert names_of(SearchableParent.get_searchable_properties()) == ['id']
+
+    class SearchableChild(SearchableParent):
+        class Meta:
+            searchable_relations = {SimpleModel.pkA}
+
+    assert names_of(SearchableChild.get_searchable_properties()) == ['id', 'pkA']
+
+
 @labeled_tests({
     'column': [ Expected([]),
         ComplicatedModel.pkC,
@@ -375,6 +400,26 @@ def test_find_searchable_column(prop: str|Column, expected: list[str]):
     assert [t.name for t in foreign_tables] == expected
 
 
+def test_find_searchable_column__earliest_match():
+    class Patron(DAOModel, table=True):
+        id: Identifier[int]
+        name: str
+
+    class LibraryPatron(DAOModel, table=True):
+        id: Identifier[int]
+        name: str
+
+    class Library(DAOModel, table=True):
+        id: Identifier[int]
+
+        class Meta:
+            searchable_relations = [LibraryPatron.name, Patron.name]
+
+    foreign_tables = []
+    assert Library.find_searchable_column('patron.name', foreign_tables) is LibraryPatron.name
+    assert [t.name for t in foreign_tables] == ['library_patron']
+
+
 def test_find_searchable_column__foreign_without_table():
     with pytest.raises(UnsearchableError):
         ComplicatedModel.find_searchable_column('prop', [])
@@ -28,6 +28,8 @@ class Rental(DAOModel, table=True):
     cost: int
 
 
+PK_FIELDS = ('address', 'apt')
+
 one_full = Decimal('1')
 one_full_one_half = Decimal('1.1')
 two_full = Decimal('2')
@@ -97,22 +99,19 @@ single_family = Rental(
 )
 
 
+DWELLING_TYPE_RANKS = {
+    'Apartment': -1,
+    'Multi-family House': -1,
+    'Town home': 1,
+    'House': 1
+}
+
+
 def prefer_better_dwelling_type(values: list[str]) -> Preference:
     """Prefer better dwelling types based on predefined categories."""
     left, right = values
-    bad = ['Apartment', 'Multi-family House']
-    good = ['Town home', 'House']
-
-    def get_value(dwelling_type: str):
-        if dwelling_type in bad:
-            return -1
-        elif dwelling_type in good:
-            return 1
-        else:
-            return 0
-
-    left_value = get_value(left)
-    right_value = get_value(right)
+    left_value = DWELLING_TYPE_RANKS.get(left, 0)
+    right_value = DWELLING_TYPE_RANKS.get(right, 0)
 
     return (
         Preference.LEFT if left_value > right_value else
@@ -262,7 +261,7 @@ def test_model_diff(left: Rental, right: Rental, expected: dict[str, tuple[Any,
 })
 def test_model_diff__pk(left: Rental, right: Rental, expected: dict[str, tuple[Any, Any]]):
     diff = ModelDiff(left, right, include_pk=True)
-    pk_diff = {key: diff[key] for key in ['address', 'apt'] if key in diff}
+    pk_diff = {key: diff[key] for key in diff.keys() & PK_FIELDS}
     assert pk_diff == expected
 
 
@@ -101,13 +101,19 @@ all_properties = [
     'field_override_optional',
     'field_override_none'
 ]
+pk_properties = [name for name in all_properties if 'pk_' in name]
+fk_properties = [name for name in all_properties if 'fk_' in name]
+pk_fk_properties = [name for name in all_properties if 'pk_fk_' in name]
+field_properties = [name for name in all_properties if 'field_' in name]
+default_properties = [name for name in all_properties if 'default' in name]
+none_properties = [name for name in all_properties if 'none' in name]
 
 @pytest.mark.parametrize('property_filter, expected', [
     (ALL, all_properties),
-    (PK, {name for name in all_properties if 'pk_' in name}),
-    (FK, {name for name in all_properties if 'fk_' in name}),
-    (DEFAULT, {name for name in all_properties if 'default' in name}),
-    (NONE, {name for name in all_properties if 'none' in name})
+    (PK, pk_properties),
+    (FK, fk_properties),
+    (DEFAULT, default_properties),
+    (NONE, none_properties)
 ])
 def test_basic_filter(property_filter: BasicPropertyFilter, expected: list[str]):
     assert property_filter.evaluate(property_model) == set(expected)
@@ -124,7 +130,7 @@ def test_or_filter(property_filter: BasicPropertyFilter):
     assert (property_filter | ~property_filter).evaluate(property_model) == set(all_properties)
 
 @pytest.mark.parametrize('property_filter, expected', [
-    (PK & FK, {name for name in all_properties if 'pk_fk_' in name}),
+    (PK & FK, pk_fk_properties),
     (DEFAULT & NONE, {'pk_default_none', 'pk_fk_default_none', 'fk_default_none', 'field_default_none'}),
     (PK & DEFAULT, {'pk_default_none', 'pk_default', 'pk_default_optional', 'pk_fk_default_none', 'pk_fk_default', 'pk_fk_default_optional'}),
     (FK & NONE, {'pk_fk_default_none', 'pk_fk_override_none', 'fk_default_none', 'fk_override_none'}),
@@ -153,7 +159,7 @@ def test_evaluate_to_no_results():
             'fk_override_optional'
         }),
     'standard fields':
-        (~PK & ~FK, {name for name in all_properties if 'field_' in name}),
+        (~PK & ~FK, set(field_properties)),
     'keys':
         (PK | FK, {
             'pk_value',
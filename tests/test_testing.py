@@ -0,0 +1,44 @@
+from daomodel.testing import labeled_tests, Expected
+
+
+def parametrized_cases(test_func) -> tuple[list, list[str]]:
+    mark = test_func.pytestmark[0]
+    return mark.args[1], mark.kwargs['ids']
+
+
+shared_tests = {
+    'plain': (1, 'one'),
+    'shared expectation': [Expected('many'),
+        2,
+        3
+    ]
+}
+
+
+def test_labeled_tests():
+    @labeled_tests(shared_tests)
+    def decorated(value: int, expected: str):
+        pass
+
+    assert parametrized_cases(decorated) == (
+        [(1, 'one'), (2, 'many'), (3, 'many')],
+        ['plain', 'shared expectation', 'shared expectation']
+    )
+
+
+def test_labeled_tests__reused_table():
+    @labeled_tests(shared_tests)
+    def first(value: int, expected: str):
+        pass
+
+    @labeled_tests(shared_tests)
+    def second(value: int, expected: str):
+        pass
+
+    assert parametrized_cases(first) == parametrized_cases(second)
+
+
+def test_labeled_tests__input_unmodified():
+    group = [Expected('many'), 2, 3]
+    labeled_tests({'group': group})(lambda value, expected: None)
+    assert group == [Expected('many'), 2, 3]
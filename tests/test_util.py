@@ -35,8 +35,9 @@ def test_values_from_dict(keys: tuple[str, ...], expected: tuple):
 
 
 def test_values_from_dict__missing():
-    with pytest.raises(MissingInput):
+    with pytest.raises(MissingInput) as exc_info:
         values_from_dict('a', 'b', 'd', a=1, b=2, c=3)
+    assert exc_info.value.__suppress_context__
 
 
 @pytest.mark.parametrize('keys, expected', [